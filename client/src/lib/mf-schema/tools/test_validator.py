@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Tests for validator.py
+
+Checks that stream mode reports the same results as a full parse, and that
+cached results are discarded when the SVG or the schema changes, including
+through the command line.
+
+Usage:
+    python -m unittest test_validator.py
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import validator  # noqa: E402
+
+CANONICAL_SVG = Path(__file__).parent.parent / 'examples' / 'canonical.svg'
+
+
+def _variants(src: str) -> dict:
+    """Altered copies of the canonical example, each exercising different checks."""
+    metadata = re.search(r'<metadata id="mf-accessibility">(.*?)</metadata>', src, flags=re.S).group(1)
+    return {
+        'canonical': src,
+        'no-namespace': src.replace(' xmlns="http://www.w3.org/2000/svg"', ''),
+        'no-title': re.sub(r'<title[^>]*>.*?</title>', '', src, flags=re.S),
+        'blank-desc': re.sub(r'<desc id="desc">.*?</desc>', '<desc id="desc">  </desc>', src, flags=re.S),
+        'no-defs': re.sub(r'<defs>.*?</defs>', '', src, flags=re.S),
+        'bare-style': re.sub(r'<style>.*?</style>', '<style>.q{}</style>', src, flags=re.S),
+        'bad-json': src.replace(metadata, metadata.replace('{', '{,', 1)),
+        'bad-concepts': src.replace(
+            metadata, '{"version": "1.0.0", "concepts": [{"role": "Agent"}, 5]}'),
+        'no-metadata': re.sub(r'<metadata.*?</metadata>', '', src, flags=re.S),
+        'comments': src.replace('<title', '<!-- c --><?pi x?><title', 1),
+        'group-in-defs': src.replace(
+            '</defs>', '<g id="inner" data-concept="X" role="group" tabindex="0" aria-label="d"/></defs>'),
+        'malformed': src.replace('</svg>', '</svgx>'),
+        'internal-entities': '<!DOCTYPE svg [<!ENTITY task "Make the bed">]>\n' + src.replace(
+            '<title id="title">Make the bed</title>', '<title id="title">&task;</title>').replace(
+            '"utterance": "Make the bed"', '"utterance": "&task;"'),
+    }
+
+
+class StreamParityTest(unittest.TestCase):
+    """Stream mode must report exactly what a full parse reports."""
+
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        src = CANONICAL_SVG.read_text(encoding='utf-8')
+        self.svg_paths = {}
+        for name, text in _variants(src).items():
+            path = self.tmp_dir / f'{name}.svg'
+            path.write_text(text, encoding='utf-8')
+            self.svg_paths[name] = path
+
+    def assert_parity(self):
+        for name, path in self.svg_paths.items():
+            with self.subTest(name):
+                full = validator.SVGValidator(path).validate()
+                stream = validator.SVGValidator(path, stream_mode=True).validate()
+                self.assertEqual(full, stream)
+
+    def test_canonical_is_valid(self):
+        for name in ('canonical', 'internal-entities'):
+            with self.subTest(name):
+                is_valid, errors, _ = validator.SVGValidator(self.svg_paths[name]).validate()
+                self.assertTrue(is_valid, errors)
+
+    def test_full_and_stream_agree(self):
+        self.assert_parity()
+
+    @unittest.skipUnless(validator.IJSON_AVAILABLE, "ijson not installed")
+    def test_full_and_stream_agree_with_ijson(self):
+        # ijson decodes the metadata only when the basic checks replace the schema
+        with mock.patch.object(validator, 'SCHEMA_VALIDATION_AVAILABLE', False), \
+                mock.patch.object(validator, 'STREAM_METADATA_THRESHOLD', 0), \
+                mock.patch.object(validator.SVGValidator, '_stream_metadata',
+                                  autospec=True, side_effect=validator.SVGValidator._stream_metadata) as stream_metadata:
+            self.assert_parity()
+        self.assertTrue(stream_metadata.called)
+
+
+class ResultCacheTest(unittest.TestCase):
+    """Cached results must not outlive changes to the SVG or the schema."""
+
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.svg_path = self.tmp_dir / 'pictogram.svg'
+        shutil.copy(CANONICAL_SVG, self.svg_path)
+        self.schema_path = self.tmp_dir / 'metadata.schema.json'
+        shutil.copy(validator.DEFAULT_SCHEMA_PATH, self.schema_path)
+
+    def touch_later(self, path: Path):
+        """Move the mtime forward so the change is seen even on coarse clocks."""
+        mtime_ns = path.stat().st_mtime_ns + 10**9
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def validate(self):
+        return validator.validate_file(self.svg_path, self.schema_path)
+
+    def test_svg_change_invalidates(self):
+        self.assertTrue(self.validate()[0])
+        text = self.svg_path.read_text(encoding='utf-8')
+        self.svg_path.write_text(re.sub(r'<title[^>]*>.*?</title>', '', text, flags=re.S), encoding='utf-8')
+        self.touch_later(self.svg_path)
+        is_valid, errors, _ = self.validate()
+        self.assertFalse(is_valid)
+        self.assertIn("Missing required <title> element", errors)
+
+    @unittest.skipUnless(validator.SCHEMA_VALIDATION_AVAILABLE, "jsonschema not installed")
+    def test_schema_change_invalidates(self):
+        self.assertTrue(self.validate()[0])
+        schema = json.loads(self.schema_path.read_text(encoding='utf-8'))
+        schema['required'] = list(schema.get('required', [])) + ['not-in-metadata']
+        self.schema_path.write_text(json.dumps(schema), encoding='utf-8')
+        self.touch_later(self.schema_path)
+        self.assertFalse(self.validate()[0])
+
+    def test_read_errors_are_not_reused(self):
+        # A permission fix doesn't change the mtime, so the error must not be memoised
+        with mock.patch.object(validator, 'open', create=True, side_effect=PermissionError("denied")):
+            is_valid, errors, _ = self.validate()
+        self.assertFalse(is_valid)
+        self.assertEqual(errors, ("Could not read file: denied",))
+        self.assertTrue(self.validate()[0])
+
+    def test_messages_name_the_path_given(self):
+        svg_path = Path(os.path.relpath(self.tmp_dir, Path.cwd())) / 'missing.svg'
+        _, errors, _ = validator.validate_file(svg_path, self.schema_path)
+        self.assertEqual(errors, (f"File not found: {svg_path}",))
+
+    def test_saved_results_round_trip(self):
+        cache_path = self.tmp_dir / 'cache.json'
+        key = validator._cache_key(self.svg_path, self.schema_path, False)
+        results = {key[0]: (key, self.validate())}
+        validator.save_result_cache(results, cache_path)
+        self.assertEqual(validator.load_result_cache(cache_path), results)
+
+        # A later edit changes the key, so the saved entry no longer matches
+        self.touch_later(self.svg_path)
+        new_key = validator._cache_key(self.svg_path, self.schema_path, False)
+        self.assertNotEqual(validator.load_result_cache(cache_path)[key[0]][0], new_key)
+
+    def test_outdated_or_corrupt_cache_is_ignored(self):
+        cache_path = self.tmp_dir / 'cache.json'
+        key = validator._cache_key(self.svg_path, self.schema_path, False)
+        cache_path.write_text(json.dumps({'version': None, 'results': {key[0]: [key, [True, [], []]]}}))
+        self.assertEqual(validator.load_result_cache(cache_path), {})
+        cache_path.write_text('not json')
+        self.assertEqual(validator.load_result_cache(cache_path), {})
+
+
+class CommandLineTest(unittest.TestCase):
+    """Each file named on the command line gets its own result and exit status."""
+
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        src = CANONICAL_SVG.read_text(encoding='utf-8')
+        (self.tmp_dir / 'good.svg').write_text(src, encoding='utf-8')
+        (self.tmp_dir / 'bad.svg').write_text(
+            re.sub(r'<title[^>]*>.*?</title>', '', src, flags=re.S), encoding='utf-8')
+
+    def run_validator(self, *args):
+        """Run validator.py in tmp_dir; return its exit code and the (file, status) pairs reported."""
+        env = dict(os.environ, XDG_CACHE_HOME=str(self.tmp_dir / 'cache'))
+        proc = subprocess.run(
+            [sys.executable, str(Path(validator.__file__).resolve()), *args],
+            cwd=self.tmp_dir, env=env, capture_output=True, text=True,
+        )
+        reported = re.findall(r'^File: (.*)\nStatus: \S+ (\w+)$', proc.stdout, flags=re.M)
+        return proc.returncode, reported
+
+    def test_repeated_paths(self):
+        # Written differently, but both resolve to the same file
+        alias = f'../{self.tmp_dir.name}/good.svg'
+        expected = [('good.svg', 'VALID'), (alias, 'VALID'), ('bad.svg', 'INVALID')]
+        for extra in (['--no-cache'], []):
+            with self.subTest(extra):
+                returncode, reported = self.run_validator(*extra, 'good.svg', alias, 'bad.svg')
+                self.assertEqual(reported, expected)
+                self.assertEqual(returncode, 1)
+
+    def test_saved_results_stay_with_their_file(self):
+        self.run_validator('good.svg', f'../{self.tmp_dir.name}/good.svg', 'bad.svg')
+        self.assertEqual(self.run_validator('bad.svg'), (1, [('bad.svg', 'INVALID')]))
+        self.assertEqual(self.run_validator('good.svg'), (0, [('good.svg', 'VALID')]))
+
+
+if __name__ == '__main__':
+    unittest.main()
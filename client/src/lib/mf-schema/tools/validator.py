@@ -11,25 +11,94 @@ Checks for:
 - Concept-to-group correspondence
 
 Usage:
-    python validator.py <svg-file>
+    python validator.py <svg-file> [<svg-file> ...]
     python validator.py --help
 """
 
 import argparse
+import functools
 import json
+import os
+import re
 import sys
+from importlib import metadata as importlib_metadata
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Dict, List, Tuple
-import xml.etree.ElementTree as ET
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+    XML_PARSE_ERRORS = (ET.ParseError, ET.XMLSyntaxError)
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+    XML_PARSE_ERRORS = (ET.ParseError,)
+
+# lxml keeps comments and processing instructions as nodes, which would cut
+# element text short (e.g. the JSON in <metadata>); drop them as ElementTree does.
+# Only entities declared in the internal DTD subset are expanded, as ElementTree
+# does; external entities, DTD loading and network access are disabled.
+LXML_PARSE_OPTIONS = {
+    'remove_comments': True,
+    'remove_pis': True,
+    'resolve_entities': 'internal',
+    'load_dtd': False,
+    'no_network': True,
+    'huge_tree': False,
+}
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+
+    def _json_loads(data):
+        """
+        Parse JSON with orjson, retrying with the json module on failure.
+
+        orjson rejects input json accepts (NaN, Infinity, numbers that overflow
+        a double), so only the error path pays for the second parse and results
+        match the json module. Integers wider than 64 bits are still read as
+        floats by orjson.
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 try:
     import jsonschema
     JSONSCHEMA_AVAILABLE = True
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
+
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+SCHEMA_VALIDATION_AVAILABLE = JSONSCHEMA_AVAILABLE or FASTJSONSCHEMA_AVAILABLE
+if not SCHEMA_VALIDATION_AVAILABLE:
     print("Warning: jsonschema not installed. Metadata validation will be limited.")
     print("Install with: pip install jsonschema")
 
+# Exceptions raised when the schema itself is invalid
+SCHEMA_DEFINITION_ERRORS: Tuple[type, ...] = ()
+if JSONSCHEMA_AVAILABLE:
+    SCHEMA_DEFINITION_ERRORS += (jsonschema.SchemaError,)
+if FASTJSONSCHEMA_AVAILABLE:
+    SCHEMA_DEFINITION_ERRORS += (fastjsonschema.JsonSchemaDefinitionException,)
+
 
 # Namespace definitions
 NS = {
@@ -37,23 +106,234 @@ NS = {
     'xlink': 'http://www.w3.org/1999/xlink'
 }
 
+# Signature of a compiled schema check: returns an error message, or None if valid
+SchemaCheck = Callable[[object], Optional[str]]
+
+# Schema used when no custom schema is given
+DEFAULT_SCHEMA_PATH = Path(__file__).parent.parent / 'schemas' / 'metadata.schema.json'
+
+# In stream mode, metadata blocks longer than this (in characters) are decoded
+# incrementally with ijson when only the basic checks will run
+STREAM_METADATA_THRESHOLD = 64 * 1024
+
+# Validation results saved between command-line runs
+RESULT_CACHE_PATH = (
+    Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'mf-validator.json'
+)
+
+# Results of validate_file() keyed by _cache_key(), oldest first
+_RESULT_MEMO: Dict[Tuple, Tuple[bool, Tuple[str, ...], Tuple[str, ...]]] = {}
+_RESULT_MEMO_SIZE = 4096
+
+# Compiled schema checks keyed by schema path, as (st_mtime_ns, check)
+_VALIDATOR_CACHE: Dict[str, Tuple[int, SchemaCheck]] = {}
+
+# Clark-notation prefix for tags in the SVG namespace
+SVG_PREFIX = f"{{{NS['svg']}}}"
+
+# Direct children of the root collected by the tree scan, mapped to attribute names
+TOP_LEVEL_SLOTS = {
+    'title': '_title',
+    'desc': '_desc',
+    'metadata': '_metadata_elem',
+    'defs': '_defs',
+}
+
+# Snippets the embedded stylesheet should contain, with the warning for each one missing
+STYLESHEET_REQUIREMENTS = (
+    ('.f', "Embedded stylesheet should define class '.f'"),
+    ('.k', "Embedded stylesheet should define class '.k'"),
+    ('@media (prefers-contrast: high)',
+     "Embedded stylesheet should include '@media (prefers-contrast: high)'"),
+    ('@media (forced-colors: active)',
+     "Embedded stylesheet should include '@media (forced-colors: active)'"),
+)
+
+# Finds the first non-whitespace character; tests for blank text without copying it
+_HAS_NONSPACE = re.compile(r'\S').search
+
+# Structure checked by SVGValidator._validate_metadata_basic(), expressed as a JSON Schema
+BASIC_METADATA_SCHEMA = {
+    '$schema': 'http://json-schema.org/draft-07/schema#',
+    'type': 'object',
+    'required': ['version', 'utterance', 'nsm', 'concepts', 'provenance'],
+    'properties': {
+        'concepts': {
+            'type': 'array',
+            'minItems': 1,
+            'items': {
+                'type': 'object',
+                'required': ['role', 'label'],
+                # id is required only for non-implicit concepts
+                'anyOf': [
+                    {'required': ['id']},
+                    {'required': ['implicit'], 'properties': {'implicit': {'const': True}}},
+                ],
+            },
+        },
+    },
+}
+
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
 
 
+def _compile_jsonschema(schema: dict) -> SchemaCheck:
+    """Build a reusable jsonschema check, raising SchemaError if the schema is invalid."""
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+
+    def check(instance) -> Optional[str]:
+        # Report the same error jsonschema.validate() would raise
+        error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+        return None if error is None else error.message
+
+    return check
+
+
+def _compile_schema(schema: dict) -> SchemaCheck:
+    """
+    Compile a schema into a reusable check.
+
+    fastjsonschema generates Python code specialised for the schema and is
+    used to accept valid metadata. When jsonschema is installed it has the
+    final say on anything fastjsonschema rejects, so results and error
+    messages match jsonschema; it is also used alone when fastjsonschema is
+    missing or cannot compile the schema.
+    """
+    fallback = _compile_jsonschema(schema) if JSONSCHEMA_AVAILABLE else None
+
+    if FASTJSONSCHEMA_AVAILABLE:
+        try:
+            # Don't fill in defaults (that would mutate the metadata) and don't
+            # check formats, matching jsonschema's default behaviour
+            validate = fastjsonschema.compile(schema, use_default=False, use_formats=False)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            if fallback is None:
+                raise
+        else:
+            def check(instance) -> Optional[str]:
+                try:
+                    validate(instance)
+                except fastjsonschema.JsonSchemaValueException as e:
+                    # fastjsonschema is stricter in places: '$' in a pattern
+                    # does not match before a trailing newline, as it does in
+                    # jsonschema. Only failures pay for the second check.
+                    return e.message if fallback is None else fallback(instance)
+                return None
+
+            return check
+
+    return fallback
+
+
+@functools.lru_cache(maxsize=None)
+def _get_basic_metadata_check() -> Optional[Callable[[object], object]]:
+    """
+    Return BASIC_METADATA_SCHEMA compiled with fastjsonschema, or None if it is missing.
+
+    Compiled on first use: with fastjsonschema installed, schema validation is
+    available, so the basic checks only run when the schema file is missing or
+    cannot be loaded.
+    """
+    if not FASTJSONSCHEMA_AVAILABLE:
+        return None
+    return fastjsonschema.compile(BASIC_METADATA_SCHEMA)
+
+
+def _get_schema_validator(schema_path: Path) -> SchemaCheck:
+    """
+    Return a compiled check for the given schema file.
+
+    The schema is loaded and compiled only once; the result is reused until
+    the file's modification time changes.
+    """
+    key = str(schema_path)
+    mtime = schema_path.stat().st_mtime_ns
+    cached = _VALIDATOR_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(schema_path, 'rb') as f:
+        schema = _json_loads(f.read())
+
+    check = _compile_schema(schema)
+    _VALIDATOR_CACHE[key] = (mtime, check)
+    return check
+
+
+class _Utf8Reader:
+    """
+    Binary file over a str, encoding one slice per read.
+
+    ijson reads bytes; this avoids encoding a large block up front.
+    """
+
+    def __init__(self, text: str):
+        self._text = text
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            end = len(self._text)
+        elif size == 0:
+            # ijson probes the stream type with read(0)
+            return b''
+        else:
+            # UTF-8 uses up to 4 bytes per character
+            end = self._pos + max(1, size // 4)
+        chunk = self._text[self._pos:end]
+        self._pos += len(chunk)
+        return chunk.encode('utf-8')
+
+
 class SVGValidator:
     """Validator for MediaFranca SVG pictograms."""
 
-    def __init__(self, svg_path: Path, schema_path: Path = None):
+    # Shared lxml parser; IDs are never looked up, so the xml:id table is not built.
+    # With ElementTree, None selects the default parser.
+    _PARSER = ET.XMLParser(collect_ids=False, **LXML_PARSE_OPTIONS) if LXML_AVAILABLE else None
+
+    # TOP_LEVEL_SLOTS keyed by full tag, for each namespace prefix the root may use
+    _SLOTS_BY_PREFIX = {
+        prefix: {prefix + name: slot for name, slot in TOP_LEVEL_SLOTS.items()}
+        for prefix in (SVG_PREFIX, '')
+    }
+
+    # Required attributes as (name, expected value); None means any value is accepted
+    _ROOT_ATTRS = (
+        ('role', 'img'),
+        ('aria-labelledby', None),
+    )
+    _SEMANTIC_GROUP_ATTRS = (
+        ('role', 'group'),
+        ('tabindex', '0'),
+        ('aria-label', None),
+    )
+
+    def __init__(self, svg_path: Path, schema_path: Path = None, stream_mode: bool = False):
         self.svg_path = svg_path
-        self.schema_path = schema_path or (
-            Path(__file__).parent.parent / 'schemas' / 'metadata.schema.json'
-        )
+        self.schema_path = schema_path or DEFAULT_SCHEMA_PATH
+        # Parse incrementally, keeping only the elements the checks need
+        self.stream_mode = stream_mode
         self.tree = None
         self.root = None
+        # Tag prefix used by the document: SVG_PREFIX, or '' if un-namespaced
+        self._ns_prefix = ''
         self.metadata = None
+        # Elements collected by _scan_tree()
+        self._title = None
+        self._desc = None
+        self._metadata_elem = None
+        self._defs = None
+        self._defs_style = None
+        self._groups: List = []
+        # IDs of the collected groups, set by _check_semantic_groups()
+        self._group_ids = frozenset()
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
@@ -66,9 +346,16 @@ class SVGValidator:
         """
         self.errors = []
         self.warnings = []
+        # Cleared when the result depends on more than the files' contents
+        # (e.g. permissions), so it must not be reused while their mtimes match
+        self.cacheable = True
 
         try:
-            self._parse_svg()
+            if self.stream_mode:
+                self._stream_svg()
+            else:
+                self._parse_svg()
+                self._scan_tree()
             self._check_root_attributes()
             self._check_title_and_desc()
             self._extract_and_validate_metadata()
@@ -78,6 +365,7 @@ class SVGValidator:
         except ValidationError as e:
             self.errors.append(str(e))
         except Exception as e:
+            self.cacheable = False
             self.errors.append(f"Unexpected error: {e}")
 
         is_valid = len(self.errors) == 0
@@ -86,25 +374,123 @@ class SVGValidator:
     def _parse_svg(self):
         """Parse the SVG file."""
         try:
-            self.tree = ET.parse(self.svg_path)
+            # Open the file here: lxml reports every I/O problem on a path as a
+            # plain OSError, but open() raises the specific subclass
+            with open(self.svg_path, 'rb') as f:
+                self.tree = ET.parse(f, self._PARSER)
             self.root = self.tree.getroot()
-        except ET.ParseError as e:
+        except XML_PARSE_ERRORS as e:
             raise ValidationError(f"XML parsing error: {e}")
         except FileNotFoundError:
             raise ValidationError(f"File not found: {self.svg_path}")
+        except OSError as e:
+            self.cacheable = False
+            raise ValidationError(f"Could not read file: {e}")
+
+        self._check_root_element()
 
-        # Check root element
-        if self.root.tag != f"{{{NS['svg']}}}svg" and self.root.tag != 'svg':
+    def _check_root_element(self):
+        """Check that the root element is <svg>."""
+        if self.root.tag != SVG_PREFIX + 'svg' and self.root.tag != 'svg':
             raise ValidationError(f"Root element must be <svg>, found: {self.root.tag}")
 
+        # All other elements are matched in the root's namespace only
+        self._ns_prefix = SVG_PREFIX if self.root.tag.startswith('{') else ''
+
+    def _stream_svg(self):
+        """
+        Parse the SVG incrementally, collecting the checked elements as they complete.
+
+        This replaces _parse_svg() and _scan_tree() in stream mode. The root is
+        checked as soon as it opens, so a non-SVG document is rejected without
+        reading the rest of the file. Every other element is detached once parsed
+        unless a check needs it, so memory grows with document depth and the
+        number of groups rather than with the size of the tree.
+        """
+        found = {}
+        style = None
+        groups = []
+        stack = []
+
+        parse_options = LXML_PARSE_OPTIONS if LXML_AVAILABLE else {}
+        try:
+            for event, elem in ET.iterparse(str(self.svg_path), events=('start', 'end'),
+                                            **parse_options):
+                if event == 'start':
+                    if not stack:
+                        self.root = elem
+                        self._check_root_element()
+                        slots = self._SLOTS_BY_PREFIX[self._ns_prefix]
+                        style_tag = self._ns_prefix + 'style'
+                        group_tag = self._ns_prefix + 'g'
+                    elif elem.tag == group_tag:
+                        # Collected on start to keep document order for nested groups
+                        groups.append(elem)
+                    stack.append(elem)
+                    continue
+
+                stack.pop()
+                if not stack:
+                    continue
+
+                parent = stack[-1]
+                if parent is self.root:
+                    slot = slots.get(elem.tag)
+                    if slot is not None and slot not in found:
+                        found[slot] = elem
+                        continue
+                elif (style is None and len(stack) == 2 and elem.tag == style_tag
+                        and slots.get(parent.tag) == '_defs' and '_defs' not in found):
+                    style = elem
+                    continue
+
+                # Groups stay referenced from the groups list with their attributes
+                parent.remove(elem)
+        except XML_PARSE_ERRORS as e:
+            raise ValidationError(f"XML parsing error: {e}")
+        except FileNotFoundError:
+            raise ValidationError(f"File not found: {self.svg_path}")
+        except OSError as e:
+            self.cacheable = False
+            raise ValidationError(f"Could not read file: {e}")
+
+        self.tree = ET.ElementTree(self.root)
+        self._store_scan(found, style, groups)
+
+    def _scan_tree(self):
+        """
+        Collect the elements used by the checks in a single walk of the tree.
+
+        <title>, <desc>, <metadata> and <defs> are taken from the direct
+        children of the root, <style> from the direct children of <defs>, and
+        <g> elements from anywhere in the document.
+        """
+        slots = self._SLOTS_BY_PREFIX[self._ns_prefix]
+        group_tag = self._ns_prefix + 'g'
+        found = {}
+        groups = []
+        for child in self.root:
+            slot = slots.get(child.tag)
+            if slot is not None and slot not in found:
+                found[slot] = child
+            groups.extend(child.iter(group_tag))
+
+        style = None
+        defs = found.get('_defs')
+        if defs is not None:
+            style = defs.find(self._ns_prefix + 'style')
+        self._store_scan(found, style, groups)
+
+    def _store_scan(self, found: Dict, style, groups: List):
+        """Store the elements collected by _scan_tree() or _stream_svg()."""
+        for slot in TOP_LEVEL_SLOTS.values():
+            setattr(self, slot, found.get(slot))
+        self._defs_style = style
+        self._groups = groups
+
     def _check_root_attributes(self):
         """Check required attributes on the root <svg> element."""
-        required_attrs = {
-            'role': 'img',
-            'aria-labelledby': None,  # Must exist but value varies
-        }
-
-        for attr, expected_value in required_attrs.items():
+        for attr, expected_value in self._ROOT_ATTRS:
             actual_value = self.root.get(attr)
             if actual_value is None:
                 self.errors.append(f"Missing required attribute on <svg>: {attr}")
@@ -122,18 +508,13 @@ class SVGValidator:
 
     def _check_title_and_desc(self):
         """Check for required <title> and <desc> elements."""
-        title = self.root.find('svg:title', NS)
-        if title is None:
-            title = self.root.find('title')
-
-        desc = self.root.find('svg:desc', NS)
-        if desc is None:
-            desc = self.root.find('desc')
+        title = self._title
+        desc = self._desc
 
         if title is None:
             self.errors.append("Missing required <title> element")
         else:
-            if not title.text or not title.text.strip():
+            if not title.text or _HAS_NONSPACE(title.text) is None:
                 self.errors.append("<title> element is empty")
             if not title.get('id'):
                 self.warnings.append("<title> should have an 'id' attribute")
@@ -141,18 +522,14 @@ class SVGValidator:
         if desc is None:
             self.errors.append("Missing required <desc> element")
         else:
-            if not desc.text or not desc.text.strip():
+            if not desc.text or _HAS_NONSPACE(desc.text) is None:
                 self.errors.append("<desc> element is empty")
             if not desc.get('id'):
                 self.warnings.append("<desc> should have an 'id' attribute")
 
     def _extract_and_validate_metadata(self):
         """Extract and validate the metadata block."""
-        # Find metadata element
-        metadata_elem = self.root.find('svg:metadata', NS)
-        if metadata_elem is None:
-            metadata_elem = self.root.find('metadata')
-
+        metadata_elem = self._metadata_elem
         if metadata_elem is None:
             raise ValidationError("Missing required <metadata> element")
 
@@ -165,22 +542,67 @@ class SVGValidator:
 
         # Extract JSON content
         metadata_text = metadata_elem.text
-        if not metadata_text or not metadata_text.strip():
+        if not metadata_text or _HAS_NONSPACE(metadata_text) is None:
             raise ValidationError("<metadata> element is empty")
 
-        # Parse JSON
+        if (self.stream_mode and IJSON_AVAILABLE and not SCHEMA_VALIDATION_AVAILABLE
+                and len(metadata_text) > STREAM_METADATA_THRESHOLD):
+            self._stream_metadata(metadata_text)
+            self.warnings.append("Skipping JSON schema validation (jsonschema not installed)")
+            self._validate_metadata_basic()
+            return
+
+        # Parse JSON (orjson.JSONDecodeError and json.JSONDecodeError are both ValueErrors)
         try:
-            self.metadata = json.loads(metadata_text)
-        except json.JSONDecodeError as e:
+            self.metadata = _json_loads(metadata_text)
+        except ValueError as e:
             raise ValidationError(f"Invalid JSON in <metadata>: {e}")
 
         # Validate against schema
-        if JSONSCHEMA_AVAILABLE:
+        if SCHEMA_VALIDATION_AVAILABLE:
             self._validate_metadata_schema()
         else:
             self.warnings.append("Skipping JSON schema validation (jsonschema not installed)")
             self._validate_metadata_basic()
 
+    def _stream_metadata(self, metadata_text: str):
+        """
+        Decode the metadata incrementally, keeping only what the basic checks need.
+
+        Top-level keys are recorded with None values, except 'concepts', which is
+        built in full; nsm, provenance and other large values are never
+        materialised.
+        """
+        metadata = {}
+        builder = None
+        depth = 0
+
+        try:
+            for prefix, event, value in ijson.parse(_Utf8Reader(metadata_text)):
+                if builder is not None:
+                    builder.event(event, value)
+                    if event in ('start_map', 'start_array'):
+                        depth += 1
+                    elif event in ('end_map', 'end_array'):
+                        depth -= 1
+                    if depth == 0:
+                        metadata['concepts'] = builder.value
+                        builder = None
+                elif prefix == '' and event == 'map_key':
+                    metadata[value] = None
+                    if value == 'concepts':
+                        builder = ijson.ObjectBuilder()
+        except ijson.JSONError:
+            # Decode in full to report the same error as the default path; only
+            # invalid metadata pays for it, and input json accepts but ijson
+            # rejects (NaN, Infinity) still validates
+            try:
+                metadata = _json_loads(metadata_text)
+            except ValueError as e:
+                raise ValidationError(f"Invalid JSON in <metadata>: {e}")
+
+        self.metadata = metadata
+
     def _validate_metadata_schema(self):
         """Validate metadata against the JSON schema."""
         if not self.schema_path.exists():
@@ -189,120 +611,116 @@ class SVGValidator:
             return
 
         try:
-            with open(self.schema_path, 'r', encoding='utf-8') as f:
-                schema = json.load(f)
+            check = _get_schema_validator(self.schema_path)
+        except SCHEMA_DEFINITION_ERRORS as e:
+            self.errors.append(f"Metadata validation error: {e}")
+            return
         except Exception as e:
+            self.cacheable = False
             self.warnings.append(f"Could not load schema: {e}")
             self._validate_metadata_basic()
             return
 
         try:
-            jsonschema.validate(instance=self.metadata, schema=schema)
-        except jsonschema.ValidationError as e:
-            self.errors.append(f"Metadata schema validation error: {e.message}")
+            message = check(self.metadata)
         except Exception as e:
             self.errors.append(f"Metadata validation error: {e}")
+            return
+
+        if message is not None:
+            self.errors.append(f"Metadata schema validation error: {message}")
 
     def _validate_metadata_basic(self):
         """Basic validation of metadata structure without full schema validation."""
-        required_fields = ['version', 'utterance', 'nsm', 'concepts', 'provenance']
-
-        for field in required_fields:
-            if field not in self.metadata:
-                self.errors.append(f"Missing required metadata field: {field}")
+        # Confirms valid metadata without the loop below; only reachable in the
+        # missing-schema fallback, as fastjsonschema makes schema validation available
+        basic_metadata_check = _get_basic_metadata_check()
+        if basic_metadata_check is not None:
+            try:
+                basic_metadata_check(self.metadata)
+                return
+            except fastjsonschema.JsonSchemaValueException:
+                # Run the checks below to report every problem in detail
+                pass
+
+        # Bind lookups used in the per-concept loop to locals
+        metadata = self.metadata
+        errors_append = self.errors.append
+
+        for field in BASIC_METADATA_SCHEMA['required']:
+            if field not in metadata:
+                errors_append(f"Missing required metadata field: {field}")
 
         # Check concepts structure
-        if 'concepts' in self.metadata:
-            if not isinstance(self.metadata['concepts'], list):
-                self.errors.append("metadata.concepts must be an array")
-            elif len(self.metadata['concepts']) == 0:
-                self.errors.append("metadata.concepts array is empty")
+        if 'concepts' in metadata:
+            concepts = metadata['concepts']
+            # Decoded JSON only produces plain lists and dicts, so exact type checks suffice
+            if type(concepts) is not list:
+                errors_append("metadata.concepts must be an array")
+            elif not concepts:
+                errors_append("metadata.concepts array is empty")
             else:
-                for i, concept in enumerate(self.metadata['concepts']):
-                    if not isinstance(concept, dict):
-                        self.errors.append(f"metadata.concepts[{i}] must be an object")
+                for i, concept in enumerate(concepts):
+                    if type(concept) is not dict:
+                        errors_append(f"metadata.concepts[{i}] must be an object")
                         continue
 
                     # role and label are always required
-                    for req_field in ['role', 'label']:
-                        if req_field not in concept:
-                            self.errors.append(
-                                f"Missing required field '{req_field}' in metadata.concepts[{i}]"
-                            )
+                    if 'role' not in concept:
+                        errors_append(f"Missing required field 'role' in metadata.concepts[{i}]")
+                    if 'label' not in concept:
+                        errors_append(f"Missing required field 'label' in metadata.concepts[{i}]")
 
                     # id is required only for non-implicit concepts
-                    is_implicit = concept.get('implicit', False)
-                    if not is_implicit and 'id' not in concept:
+                    if 'id' not in concept and not concept.get('implicit', False):
                         role = concept.get('role', 'unknown')
-                        self.errors.append(
+                        errors_append(
                             f"Missing required field 'id' in metadata.concepts[{i}] (role: {role}). "
                             "Explicit concepts must have an 'id' field."
                         )
 
     def _check_embedded_stylesheet(self):
         """Check for embedded stylesheet in <defs>."""
-        defs = self.root.find('svg:defs', NS)
-        if defs is None:
-            defs = self.root.find('defs')
-
-        if defs is None:
+        if self._defs is None:
             self.warnings.append("No <defs> element found; embedded stylesheet recommended")
             return
 
-        style = defs.find('svg:style', NS)
-        if style is None:
-            style = defs.find('style')
-
+        style = self._defs_style
         if style is None:
             self.warnings.append("No <style> element in <defs>; embedded stylesheet recommended")
             return
 
         style_text = style.text or ""
 
-        # Check for required classes
-        required_classes = ['.f', '.k']
-        for cls in required_classes:
-            if cls not in style_text:
-                self.warnings.append(f"Embedded stylesheet should define class '{cls}'")
-
-        # Check for accessibility media queries
-        if '@media (prefers-contrast: high)' not in style_text:
-            self.warnings.append("Embedded stylesheet should include '@media (prefers-contrast: high)'")
-
-        if '@media (forced-colors: active)' not in style_text:
-            self.warnings.append("Embedded stylesheet should include '@media (forced-colors: active)'")
+        # Check for required classes and accessibility media queries
+        for snippet, warning in STYLESHEET_REQUIREMENTS:
+            if snippet not in style_text:
+                self.warnings.append(warning)
 
     def _check_semantic_groups(self):
         """Check that semantic groups have required attributes."""
-        # Find all <g> elements
-        groups = self.root.findall('.//svg:g', NS)
-        if not groups:
-            groups = self.root.findall('.//g')
+        self._group_ids = frozenset(filter(None, (g.get('id') for g in self._groups)))
 
-        if not groups:
+        if not self._groups:
             self.warnings.append("No <g> elements found; semantic grouping recommended")
             return
 
-        for i, group in enumerate(groups):
-            group_id = group.get('id', f'(unnamed group {i})')
+        for i, group in enumerate(self._groups):
+            # Fetch the attribute mapping once; every lookup below uses it
+            attrs = group.attrib
+            group_id = attrs.get('id', f'(unnamed group {i})')
 
             # Check for data-concept attribute
-            data_concept = group.get('data-concept')
+            data_concept = attrs.get('data-concept')
             if data_concept is None:
                 # This might be a nested group or decorative; check if it's a top-level semantic group
-                if group.get('role') == 'group':
+                if attrs.get('role') == 'group':
                     self.warnings.append(f"Group '{group_id}' has role='group' but no data-concept attribute")
 
             # If it has data-concept, check other required attributes
             if data_concept:
-                required_attrs = {
-                    'role': 'group',
-                    'tabindex': '0',
-                    'aria-label': None,
-                }
-
-                for attr, expected_value in required_attrs.items():
-                    actual_value = group.get(attr)
+                for attr, expected_value in self._SEMANTIC_GROUP_ATTRS:
+                    actual_value = attrs.get(attr)
                     if actual_value is None:
                         self.errors.append(
                             f"Semantic group '{group_id}' missing required attribute: {attr}"
@@ -318,11 +736,7 @@ class SVGValidator:
         if not self.metadata or 'concepts' not in self.metadata:
             return
 
-        # Collect all group IDs
-        groups = self.root.findall('.//svg:g', NS)
-        if not groups:
-            groups = self.root.findall('.//g')
-        group_ids = {g.get('id') for g in groups if g.get('id')}
+        group_ids = self._group_ids
 
         # Check each concept
         for concept in self.metadata['concepts']:
@@ -353,6 +767,136 @@ class SVGValidator:
                 )
 
 
+def _mtime_ns(path: Path) -> int:
+    """Return the modification time of a file, or -1 if it cannot be read."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _cache_key(svg_path: Path, schema_path: Optional[Path], stream_mode: bool) -> Tuple:
+    """Return the memoisation key for a validation: both paths, their mtimes and the mode."""
+    schema_path = schema_path or DEFAULT_SCHEMA_PATH
+    return (
+        str(svg_path.resolve()), _mtime_ns(svg_path),
+        str(schema_path.resolve()), _mtime_ns(schema_path),
+        stream_mode,
+    )
+
+
+def _validate(svg_path: Path, schema_path: Optional[Path],
+              stream_mode: bool) -> Tuple[Tuple[bool, Tuple[str, ...], Tuple[str, ...]], bool]:
+    """
+    Validate a file, reusing the result from an earlier call with the same cache key.
+
+    Returns ((is_valid, errors, warnings), cacheable). Results that are not
+    cacheable, such as read errors, are never reused.
+    """
+    key = _cache_key(svg_path, schema_path, stream_mode)
+    result = _RESULT_MEMO.get(key)
+    if result is not None:
+        return result, True
+
+    # Messages name the paths as given, not the resolved paths in the key
+    validator = SVGValidator(svg_path, schema_path, stream_mode=stream_mode)
+    is_valid, errors, warnings = validator.validate()
+    result = (is_valid, tuple(errors), tuple(warnings))
+    if validator.cacheable:
+        if len(_RESULT_MEMO) >= _RESULT_MEMO_SIZE:
+            del _RESULT_MEMO[next(iter(_RESULT_MEMO))]
+        _RESULT_MEMO[key] = result
+    return result, validator.cacheable
+
+
+def validate_file(svg_path: Path, schema_path: Path = None,
+                  stream_mode: bool = False) -> Tuple[bool, Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Validate an SVG file, reusing the previous result if neither it nor the schema changed.
+
+    Returns:
+        Tuple of (is_valid, errors, warnings)
+    """
+    return _validate(svg_path, schema_path, stream_mode)[0]
+
+
+def validate_one(task: Tuple[Path, Optional[Path], bool]) -> Tuple[Path, bool, Tuple[str, ...], Tuple[str, ...], bool]:
+    """
+    Validate a single SVG file.
+
+    Takes a (svg_path, schema_path, stream_mode) tuple so it can be mapped over
+    a worker pool, and returns (svg_path, is_valid, errors, warnings, cacheable).
+    """
+    svg_path, schema_path, stream_mode = task
+    result, cacheable = _validate(svg_path, schema_path, stream_mode)
+    return (svg_path,) + result + (cacheable,)
+
+
+# Optional backends whose presence and version can change validation results
+_RESULT_CACHE_BACKENDS = ('lxml', 'orjson', 'ijson', 'jsonschema', 'fastjsonschema')
+
+
+@functools.lru_cache(maxsize=None)
+def _result_cache_version() -> List:
+    """
+    Identify the validator and installed backends; results saved under a
+    different version are discarded.
+    """
+    version = [_mtime_ns(Path(__file__))]
+    for name in _RESULT_CACHE_BACKENDS:
+        try:
+            version.append(importlib_metadata.version(name))
+        except importlib_metadata.PackageNotFoundError:
+            version.append(None)
+    # A backend can be installed but fail to import
+    version += [LXML_AVAILABLE, ORJSON_AVAILABLE, IJSON_AVAILABLE,
+                JSONSCHEMA_AVAILABLE, FASTJSONSCHEMA_AVAILABLE]
+    return version
+
+
+def load_result_cache(path: Path = RESULT_CACHE_PATH) -> Dict:
+    """
+    Load results saved by a previous run, as {svg_path: (cache_key, result)}.
+
+    Returns an empty cache if the file is missing, unreadable or out of date.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get('version') != _result_cache_version():
+            return {}
+        # JSON has no tuples; restore them so entries compare equal to fresh keys
+        return {
+            svg_path: (tuple(key), (bool(is_valid), tuple(errors), tuple(warnings)))
+            for svg_path, (key, (is_valid, errors, warnings)) in data['results'].items()
+        }
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return {}
+
+
+def save_result_cache(results: Dict, path: Path = RESULT_CACHE_PATH):
+    """Save results for the next run; failures only produce a warning."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': _result_cache_version(), 'results': results}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: could not save result cache: {e}", file=sys.stderr)
+
+
+def _init_worker(schema_path: Path):
+    """Compile the metadata schema once when a worker process starts."""
+    if not SCHEMA_VALIDATION_AVAILABLE:
+        return
+    try:
+        _get_schema_validator(schema_path)
+    except Exception:
+        # Each file reports schema problems when it is validated
+        pass
+
+
 def print_results(svg_path: Path, is_valid: bool, errors: List[str], warnings: List[str]):
     """Print validation results in a readable format."""
     print(f"\n{'='*70}")
@@ -389,6 +933,8 @@ def main():
 Examples:
   python validator.py examples/canonical-bed.svg
   python validator.py --schema custom-schema.json my-pictogram.svg
+  python validator.py --stream large-illustration.svg
+  python validator.py --jobs 4 examples/*.svg
 
 Exit codes:
   0 - Validation successful (no errors)
@@ -397,15 +943,33 @@ Exit codes:
         """
     )
     parser.add_argument(
-        'svg_file',
+        'svg_files',
+        metavar='svg_file',
+        nargs='+',
         type=Path,
-        help='Path to the SVG file to validate'
+        help='Path to the SVG file(s) to validate'
     )
     parser.add_argument(
         '--schema',
         type=Path,
         help='Path to custom metadata.schema.json (optional)'
     )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Parse incrementally to reduce memory use on very large SVG files'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of files to validate in parallel; 0 uses all CPUs (default: 1)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Revalidate every file instead of reusing results saved in {RESULT_CACHE_PATH}'
+    )
     parser.add_argument(
         '--quiet',
         action='store_true',
@@ -413,25 +977,77 @@ Exit codes:
     )
 
     args = parser.parse_args()
-
-    # Check file exists
-    if not args.svg_file.exists():
-        print(f"Error: File not found: {args.svg_file}", file=sys.stderr)
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or a positive number")
+    jobs = args.jobs or os.cpu_count() or 1
+
+    # Check files exist
+    missing = [path for path in args.svg_files if not path.exists()]
+    for path in missing:
+        print(f"Error: File not found: {path}", file=sys.stderr)
+    if missing:
         return 2
 
-    # Create validator
-    validator = SVGValidator(args.svg_file, args.schema)
+    tasks = [(path, args.schema, args.stream) for path in args.svg_files]
+    keys = [_cache_key(*task) for task in tasks]
+    cache = {} if args.no_cache else load_result_cache()
+
+    def is_cached(key):
+        entry = cache.get(key[0])
+        return entry is not None and entry[0] == key
+
+    # Only files changed since the last run are validated. Decide once, before
+    # merge() adds fresh results to the cache: a file named twice would
+    # otherwise look cached the second time and take another file's result.
+    cached = [is_cached(key) for key in keys]
+    pending = [task for task, hit in zip(tasks, cached) if not hit]
+
+    def merge(fresh_results):
+        """Yield results in input order, taking validated files from fresh_results."""
+        fresh_results = iter(fresh_results)
+        for task, key, hit in zip(tasks, keys, cached):
+            if hit:
+                yield (task[0],) + cache[key[0]][1]
+            else:
+                *result, cacheable = next(fresh_results)
+                if cacheable:
+                    cache[key[0]] = (key, tuple(result[1:]))
+                else:
+                    # Don't keep an older saved result for a file that now fails to read
+                    cache.pop(key[0], None)
+                yield tuple(result)
+
+    invalid_count = 0
+
+    def report(results):
+        nonlocal invalid_count
+        for svg_path, is_valid, errors, warnings in results:
+            if not is_valid:
+                invalid_count += 1
+            if args.quiet:
+                warnings = []
+            print_results(svg_path, is_valid, errors, warnings)
 
     # Run validation
-    is_valid, errors, warnings = validator.validate()
-
-    # Print results
-    if args.quiet:
-        warnings = []
-    print_results(args.svg_file, is_valid, errors, warnings)
+    if jobs > 1 and len(pending) > 1:
+        # Files are independent, so validate them in worker processes; each
+        # worker compiles the schema once up front
+        chunksize = max(1, min(16, len(pending) // (jobs * 4)))
+        with Pool(jobs, initializer=_init_worker,
+                  initargs=(args.schema or DEFAULT_SCHEMA_PATH,)) as pool:
+            report(merge(pool.imap(validate_one, pending, chunksize=chunksize)))
+    else:
+        report(merge(map(validate_one, pending)))
+
+    if not args.no_cache:
+        save_result_cache(cache)
+
+    if len(tasks) > 1:
+        print(f"Validated {len(tasks)} files: "
+              f"{len(tasks) - invalid_count} valid, {invalid_count} invalid")
 
     # Return appropriate exit code
-    return 0 if is_valid else 1
+    return 0 if invalid_count == 0 else 1
 
 
 if __name__ == '__main__':